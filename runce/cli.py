@@ -1,30 +1,36 @@
 from argparse import ArgumentParser
+from functools import lru_cache
 from shlex import join
-from sys import stderr, stdout, platform
-from subprocess import Popen, PIPE, run
+from shutil import copyfileobj
+from sys import stderr, stdout
+from subprocess import run
+from time import gmtime, strftime, time
 from typing import Any
-from .utils import check_pid, filesizepu, kill_pid, tail_bytes
+from .utils import check_pid, filesizepu, kill_pid, tail_bytes, tail_file
 from .main import Main, flag, arg
 from .procdb import ProcessDB as Manager
 
 # from .spawn import Spawn as Manager
 
+# liveness is queried several times per entry; cleared whenever we kill
+_pid_alive = lru_cache(maxsize=None)(check_pid)
+
 
 class FormatDict(dict):
     def __missing__(self, key: str) -> str:
+        # derived fields are computed on first use and kept for the rest of the row
         if key == "pid?":
-            return f'{self["pid"]}{"" if check_pid(self["pid"]) else "?"}'
+            v = f'{self["pid"]}{"" if _pid_alive(self["pid"]) else "?"}'
         elif key == "elapsed":
-            import time
-
-            return time.strftime("%H:%M:%S", time.gmtime(time.time() - self["started"]))
+            v = strftime("%H:%M:%S", gmtime(time() - self["started"]))
         elif key == "command":
-            if isinstance(self["cmd"], str):
-                return self["cmd"]
-            return join(self["cmd"])
+            v = self["cmd"] if isinstance(self["cmd"], str) else join(self["cmd"])
         elif key == "pid_status":
-            return "Live" if check_pid(self["pid"]) else "Done"
-        raise KeyError(f"No {key!r}")
+            v = "Live" if _pid_alive(self["pid"]) else "Done"
+        else:
+            raise KeyError(f"No {key!r}")
+        self[key] = v
+        return v
 
 
 def format_prep(f: str):
@@ -51,6 +57,19 @@ def ambiguous(name):
     print(f"{name!r} is ambiguous")
 
 
+def _in_order(report, lines: "list[str] | None" = None):
+    """Wrap a report callback so its message lands after the output batched so far"""
+
+    def cb(name):
+        if lines:
+            stdout.write("\n".join(lines) + "\n")
+            lines.clear()
+        report(name)
+        stdout.flush()
+
+    return cb
+
+
 class Clean(Main):
     """Clean up dead processes."""
 
@@ -63,7 +82,7 @@ class Clean(Main):
     def start(self) -> None:
         sp = Manager()
         for d in sp.find_names(self.ids, ambiguous, no_record):
-            if check_pid(d["pid"]):
+            if _pid_alive(d["pid"]):
                 continue
             try:
                 print("🧹 ", end="")
@@ -89,9 +108,34 @@ class Status(Main):
 
     def start(self) -> None:
         f = format_prep(self.format)
-        e = ["✅", "❌"]
-        for d in Manager().find_names(self.ids, ambiguous, no_record):
-            print(f(d))
+        lines = []
+        for d in Manager().find_names(self.ids, _in_order(ambiguous, lines), _in_order(no_record, lines)):
+            lines.append(f(d))
+        if lines:
+            stdout.write("\n".join(lines) + "\n")
+
+
+def _kill(sp: Manager, x: "dict[str, Any]", dry_run=False, remove=False, group=False):
+    _errdef = ["❌", "Error"]
+    _noproc = ["👻", "No process"]
+    _killed = ["💀", "Killed"]
+    s = _errdef
+    if dry_run:
+        s = _killed
+    else:
+        if _pid_alive(x["pid"]):
+            if kill_pid(x["pid"], process_group=group):
+                s = _killed
+            _pid_alive.cache_clear()
+        else:
+            s = _noproc
+    try:
+        print(f"{s[0]} ", end="")
+    except UnicodeEncodeError:
+        pass
+    print(f'{s[1]} PID={x["pid"]} {x["name"]!r}')
+    if not dry_run and remove:
+        sp.drop(x)
 
 
 class Kill(Main):
@@ -108,49 +152,25 @@ class Kill(Main):
         return super().init_argparse(argp)
 
     def start(self) -> None:
-        _errdef = ["❌", "Error"]
-        _noproc = ["👻", "No process"]
-        _killed = ["💀", "Killed"]
         signal = int(self.signal) if self.signal else None
         sp = Manager()
         if self.ids:
             for x in sp.find_names(self.ids, ambiguous, no_record):
-                s = _errdef
-                if self.dry_run:
-                    s = _killed
-                else:
-                    if check_pid(x["pid"]):
-                        if kill_pid(x["pid"], process_group=self.group):
-                            s = _killed
-                    else:
-                        s = _noproc
-                try:
-                    print(f"{s[0]} ", end="")
-                except UnicodeEncodeError:
-                    pass
-                print(f'{s[1]} PID={x["pid"]} {x["name"]!r}')
-                if not self.dry_run and self.remove:
-                    sp.drop(x)
+                _kill(sp, x, self.dry_run, self.remove, self.group)
 
 
 def _tail(n: float, u="", out="", tab=None):
     if u:
         stdout.buffer.write(tail_bytes(out, int(n)))
     elif n > 0:
-        if platform.startswith("win"):
-            cmd = [
-                "powershell",
-                "-c",
-                f"Get-Content -Tail {int(n)} '{out}'",
-            ]
-        else:
-            cmd = ["tail", "-n", str(int(n)), out]
-        if tab:
-            with Popen(cmd, stdout=PIPE).stdout as o:
-                for line in o:
-                    stdout.buffer.write(b"\t" + line)
-        else:
-            run(cmd)
+        data = tail_file(out, int(n))
+        if data and tab:
+            data = b"\t" + data[:-1].replace(b"\n", b"\n\t") + data[-1:]
+        stdout.buffer.write(data)
+    elif n < 0:
+        # whole output, large copies keep the read/write count low for big logs
+        with open(out, "rb") as f:
+            copyfileobj(f, stdout.buffer, 1 << 20)
 
 
 class Tail(Main):
@@ -175,17 +195,59 @@ class Tail(Main):
         j = 0
         out = "err" if self.err else "out"
 
-        for x in Manager().find_names(self.ids, ambiguous, no_record):
-            if self.existing and not check_pid(x["pid"]):
+        # headers go through stdout.buffer along with the output, flush pending text first
+        stdout.flush()
+        enc = stdout.encoding or "utf-8"
+
+        for x in Manager().find_names(self.ids, _in_order(ambiguous), _in_order(no_record)):
+            if self.existing and not _pid_alive(x["pid"]):
                 continue
 
-            j > 1 and n > 0 and print()
+            j > 1 and n > 0 and stdout.buffer.write(b"\n")
             if hf:
-                print(f"{self.p_open}{hf(x)}{self.p_close}", flush=True)
+                stdout.buffer.write(f"{self.p_open}{hf(x)}{self.p_close}\n".encode(enc, "replace"))
             _tail(n, u, x[out], self.tab)
             j += 1
 
 
+def _run(
+    sp: Manager,
+    args: "list[str]",
+    name: str,
+    tail: "str | None" = None,
+    overwrite=False,
+    cwd: "str | None" = None,
+    split=False,
+    in_file="",
+    cmd_after: "str | None" = None,
+):
+    # Check for existing process first
+    e = sp.find_name(name) if name else None
+    if e:
+        s = ["🚨", r"Found: PID={pid} ({pid_status}) {name}"]
+    else:
+        # Start new process
+        e = sp.spawn(args, name, overwrite=overwrite, cwd=cwd, split=split, in_file=in_file)
+        s = ["🚀", r"Started: PID={pid} ({pid_status}) {name}"]
+    assert e
+    try:
+        print(f"{s[0]} ", end="", file=stderr)
+    except UnicodeEncodeError:
+        pass
+    hf = format_prep(s[1])
+    print(hf(e), file=stderr, flush=True)
+
+    # Handle tail output
+    if tail:
+        n, u = filesizepu(tail)
+        _tail(n, u, e["out"])
+
+    # Run post-command if specified
+    if cmd_after:
+        cmd = format_prep(cmd_after)(e)
+        run(cmd, shell=True, check=True)
+
+
 class Run(Main):
     """Run a new singleton process."""
 
@@ -205,36 +267,17 @@ class Run(Main):
     input: str = flag("i", "input", "pass FILE to stdin", metavar="FILE", default="")
 
     def start(self) -> None:
-        args = self.args
-        name = self.run_id  # or " ".join(x for x in args)
-        sp = Manager()
-
-        # Check for existing process first
-        e = sp.find_name(name) if name else None
-        if e:
-            s = ["🚨", r"Found: PID={pid} ({pid_status}) {name}"]
-        else:
-            
-            # Start new process
-            e = sp.spawn(args, name, overwrite=self.overwrite, cwd=self.cwd, split=self.split, in_file=self.input)
-            s = ["🚀", r"Started: PID={pid} ({pid_status}) {name}"]
-        assert e
-        try:
-            print(f"{s[0]} ", end="", file=stderr)
-        except UnicodeEncodeError:
-            pass
-        hf = format_prep(s[1])
-        print(hf(e), file=stderr, flush=True)
-
-        # Handle tail output
-        if self.tail:
-            n, u = filesizepu(self.tail)
-            _tail(n, u, e["out"])
-
-        # Run post-command if specified
-        if self.cmd_after:
-            cmd = format_prep(self.cmd_after)(e)
-            run(cmd, shell=True, check=True)
+        _run(
+            Manager(),
+            self.args,
+            self.run_id,
+            tail=self.tail,
+            overwrite=self.overwrite,
+            cwd=self.cwd,
+            split=self.split,
+            in_file=self.input,
+            cmd_after=self.cmd_after,
+        )
 
 
 class Ls(Main):
@@ -252,22 +295,24 @@ class Ls(Main):
 
     def start(self) -> None:
         f = self.format
+        lines = []
         if f:
             pass
         else:
             f = "{pid_status} {elapsed} {pid}\t{name}, {command}"
-            print("Stat Elapsed  PID\tName, Command")
-            print("---- -------- ------ ------------")
+            lines.append("Stat Elapsed  PID\tName, Command")
+            lines.append("---- -------- ------ ------------")
         fp = format_prep(f)
-        for d in Manager().all():
-            print(fp(d))
+        lines.extend(fp(d) for d in Manager().all())
+        if lines:
+            stdout.write("\n".join(lines) + "\n")
 
 
 class Restart(Main):
     """Restart a process."""
 
     ids: "list[str]" = arg("ID", "run ids", nargs="+")
-    tail: int = flag("t", "tail", "tail the output with n lines", default=0)
+    tail: str = flag("t", "tail", "Tail the output (n lines)")
 
     def init_argparse(self, argp: ArgumentParser) -> None:
         argp.description = "Restart a process"
@@ -278,9 +323,9 @@ class Restart(Main):
         if self.ids:
             for proc in sp.find_names(self.ids, ambiguous, no_record):
                 # First kill existing process
-                Kill().main(["--remove", proc["name"]])
+                _kill(sp, proc, remove=True)
                 # Then restart with same parameters
-                Run().main(["--id", proc["name"], "-t", self.tail, "--", *proc["cmd"]])
+                _run(sp, proc["cmd"], proc["name"], tail=self.tail)
 
 
 class App(Main):
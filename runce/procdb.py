@@ -1,4 +1,6 @@
 import sqlite3
+from ast import literal_eval
+from json import dumps, loads
 from pathlib import Path
 from .spawn import Spawn
 
@@ -7,13 +9,20 @@ class ProcessDB(Spawn):
     """SQLite database for RunCE process tracking."""
 
     db_path: Path
+    conn: sqlite3.Connection
 
     def _get_db_path(self):
         dd = self.data_dir
         dd.mkdir(parents=True, exist_ok=True)
-        db = dd / "db"
-        """Initialize the database schema."""
-        with sqlite3.connect(db) as conn:
+        return dd / "db"
+
+    def _get_conn(self):
+        """Open the database once and initialize the schema."""
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        with conn:
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS processes (
@@ -29,15 +38,24 @@ class ProcessDB(Spawn):
                 )
             """
             )
-        return db
+            conn.execute("CREATE INDEX IF NOT EXISTS processes_name ON processes (name)")
+            if conn.execute("PRAGMA user_version").fetchone()[0] < 1:
+                # cmd used to be stored as a Python repr, convert it to JSON
+                for id, cmd in conn.execute("SELECT id, cmd FROM processes").fetchall():
+                    try:
+                        loads(cmd)
+                    except ValueError:
+                        conn.execute("UPDATE processes SET cmd = ? WHERE id = ?", (dumps(literal_eval(cmd)), id))
+                conn.execute("PRAGMA user_version = 1")
+        return conn
 
     def connect(self):
-        return sqlite3.connect(self.db_path)
+        return self.conn
 
     def add_process(self, process_info: "dict[str, object]"):
         """Insert a new process record."""
         with self.connect() as conn:
-            conn.execute(
+            cursor = conn.execute(
                 """
                 INSERT INTO processes (
                     uuid, pid, name, cmd, out, err, started
@@ -47,50 +65,49 @@ class ProcessDB(Spawn):
                     process_info["uuid"],
                     process_info["pid"],
                     process_info["name"],
-                    str(process_info["cmd"]),  # Store cmd as JSON string
+                    dumps(process_info["cmd"]),  # Store cmd as JSON string
                     process_info["out"],
                     process_info["err"],
                     process_info["started"],
                 ),
             )
-        x = self.find_uuid(process_info["uuid"])
-        assert x
-        return x
+        return {
+            "id": cursor.lastrowid,
+            **{k: process_info[k] for k in ("uuid", "pid", "name", "cmd", "out", "err", "started")},
+        }
+
+    def _row(self, row: sqlite3.Row):
+        # id ,  uuid , pid , name, cmd,  out , err , started,  is_active
+        return {
+            "id": row["id"],
+            "uuid": row["uuid"],
+            "pid": row["pid"],
+            "name": row["name"],
+            "cmd": loads(row["cmd"]),
+            "out": row["out"],
+            "err": row["err"],
+            "started": row["started"],
+        }
 
     def all(self):
         """List all active processes."""
-        with self.connect() as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute("SELECT * FROM processes")
-            for row in cursor.fetchall():
-                # id ,  uuid , pid , name, cmd,  out , err , started,  is_active
-                yield {
-                    "id": row["id"],
-                    "uuid": row["uuid"],
-                    "pid": row["pid"],
-                    "name": row["name"],
-                    "cmd": eval(row["cmd"]),
-                    "out": row["out"],
-                    "err": row["err"],
-                    "started": row["started"],
-                }
+        for row in self.connect().execute("SELECT * FROM processes").fetchall():
+            yield self._row(row)
 
     def find_uuid(self, uuid: str):
         """Find a process by uuid"""
-        with self.connect() as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute("SELECT * FROM processes WHERE uuid = ? ", (uuid,))
-            for row in cursor.fetchall():
-                return {
-                    "id": row["id"],
-                    "uuid": row["uuid"],
-                    "pid": row["pid"],
-                    "name": row["name"],
-                    "cmd": eval(row["cmd"]),
-                    "out": row["out"],
-                    "err": row["err"],
-                    "started": row["started"],
-                }
+        row = self.connect().execute("SELECT * FROM processes WHERE uuid = ? ", (uuid,)).fetchone()
+        return row and self._row(row)
+
+    def find_name(self, name: str):
+        """Find a process by name"""
+        row = self.connect().execute("SELECT * FROM processes WHERE name = ? ", (name,)).fetchone()
+        return row and self._row(row)
+
+    def find_by_exact(self, name: str):
+        """Find every process named exactly 'name'; names are not unique in the table"""
+        rows = self.connect().execute("SELECT * FROM processes WHERE name = ? ", (name,)).fetchall()
+        return [self._row(row) for row in rows]
 
     def drop(self, entry: dict[str, object], clean_up=True):
         with self.connect() as conn:
@@ -1,10 +1,17 @@
 import logging
-from json import dump, load
+import os
+import signal
+from json import dumps, loads
 from uuid import uuid4
 from pathlib import Path
+from stat import S_ISREG
 from subprocess import DEVNULL, PIPE, STDOUT, Popen
 from time import time
-from .utils import generate_pseudowords, get_base_name, look_multiple
+from .utils import generate_pseudowords, get_base_name, look_each, pick_matches
+
+# signals Python ignores at startup, restored for children like Popen's restore_signals
+_SIGDEF = tuple(getattr(signal, x) for x in ("SIGPIPE", "SIGXFSZ") if hasattr(signal, x))
+_RUN_FILE_FLAGS = os.O_RDONLY | getattr(os, "O_NOFOLLOW", 0) | getattr(os, "O_BINARY", 0)
 
 
 class Spawn:
@@ -95,17 +102,49 @@ class Spawn:
         }
 
         process_info["base_name"] = base_name
-        process_info["pid"] = Popen(cmd, **po_kwa).pid
+        process_info["pid"] = self._posix_spawn(cmd, po_kwa) or Popen(cmd, **po_kwa).pid
         x = self.add_process(process_info)
         # print("PI", x)
         return x
 
+    def _posix_spawn(self, cmd: "list[str]", po_kwa: "dict[str, object]"):
+        """Launch via posix_spawn (no fork of this process) when Popen's extras are not needed."""
+        if not hasattr(os, "posix_spawnp") or po_kwa.get("cwd") or not po_kwa.get("start_new_session"):
+            return None
+        close_fds = po_kwa.get("close_fds")
+        if close_fds and not hasattr(os, "POSIX_SPAWN_CLOSEFROM"):  # 3.13+, otherwise leave it to Popen
+            return None
+        if set(po_kwa) - {"stdin", "stdout", "stderr", "start_new_session", "close_fds", "cwd"}:
+            return None
+        file_actions = []
+        for fd, v in enumerate((po_kwa.get("stdin"), po_kwa.get("stdout"), po_kwa.get("stderr"))):
+            if v is None:
+                continue
+            elif v == DEVNULL:
+                file_actions.append((os.POSIX_SPAWN_OPEN, fd, os.devnull, os.O_RDWR, 0))
+            elif v == STDOUT and fd == 2:
+                file_actions.append((os.POSIX_SPAWN_DUP2, 1, 2))
+            elif isinstance(v, int) and v >= 0:
+                file_actions.append((os.POSIX_SPAWN_DUP2, v, fd))
+            elif hasattr(v, "fileno"):
+                file_actions.append((os.POSIX_SPAWN_DUP2, v.fileno(), fd))
+            else:  # PIPE and friends
+                return None
+        if close_fds:  # after the dups, like Popen keeps only 0-2
+            file_actions.append((os.POSIX_SPAWN_CLOSEFROM, 3))
+        try:
+            return os.posix_spawnp(
+                cmd[0], cmd, os.environ, file_actions=file_actions, setsid=True, setsigdef=_SIGDEF
+            )
+        except NotImplementedError:  # no POSIX_SPAWN_SETSID on this platform
+            return None
+
     def add_process(self, process_info: "dict[str, object]"):
         """Insert a new process record."""
         # print(process_info)
         run_file = self.data_dir / f"{process_info['base_name']}.run.json"
-        with run_file.open("x") as f:
-            dump(process_info, f, indent=True)
+        with run_file.open("xb") as f:
+            f.write(dumps(process_info, indent=True).encode())
 
         return process_info
 
@@ -114,18 +153,39 @@ class Spawn:
         if not self.data_dir.is_dir():
             return
 
-        for child in self.data_dir.iterdir():
-            if child.is_file() and child.name.endswith(".run.json") and child.stat().st_size > 0:
+        with os.scandir(self.data_dir) as it:
+            for e in it:
+                name = e.name
+                if name.startswith(".") or not name.endswith(".run.json"):
+                    continue
+                st = e.stat(follow_symlinks=False)
+                if not S_ISREG(st.st_mode) or st.st_size == 0:
+                    continue
                 try:
-                    with child.open() as f:
-                        d: dict[str, int | str] = load(f)
-                        d["file"] = str(child)
-                        yield d
-                except Exception as e:
-                    logging.exception(f"Load failed {child!r} {e!s}")
+                    yield self._load(e.path)
+                except Exception as ex:
+                    logging.exception(f"Load failed {e.path!r} {ex!s}")
+
+    def _load(self, path: str):
+        with os.fdopen(os.open(path, _RUN_FILE_FLAGS), "rb") as f:
+            d: dict[str, int | str] = loads(f.read())
+        d["file"] = path
+        return d
+
+    def find_by_exact(self, name: str) -> "list[dict[str, object]]":
+        """Find the processes named exactly 'name' through the run file, without scanning"""
+        path = os.path.join(self.data_dir, f"{get_base_name(name)}.run.json")
+        try:
+            d = self._load(path)
+        except Exception:  # missing, unreadable or malformed, the full scan reports it
+            return []
+        return [d] if isinstance(d, dict) and d.get("name") == name else []
 
     def find_name(self, name: str):
         """Find a process by name"""
+        x = self.find_by_exact(name)
+        if x:
+            return x[0]
         for x in self.all():
             if x["name"] == name:
                 return x
@@ -144,6 +204,12 @@ class Spawn:
 
     def find_names(self, names: "list[str]", ambiguous=lambda x: None, not_found=lambda x: None):
         if names:
-            yield from look_multiple(names, self.all(), ambiguous, not_found)
+            # exact names are a direct lookup, only the rest needs the full listing
+            names = list(dict.fromkeys(names))
+            found = {name: self.find_by_exact(name) for name in names}
+            rest = [name for name in names if not found[name]]
+            if rest:
+                found.update(look_each(rest, self.all()))
+            yield from pick_matches(((name, found[name]) for name in names), ambiguous, not_found)
         else:
             yield from self.all()
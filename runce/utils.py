@@ -1,17 +1,33 @@
 import os
+import random
 import re
 import errno
 import hashlib
 import signal
+import string
+from functools import lru_cache
 from sys import stderr
-from typing import List, Dict, Iterator, Callable, Any, Optional
+from typing import Dict, Iterable, Iterator, Callable, Any, Optional
+
+
+class _SlugTable(dict):
+    """str.translate table: ASCII slug characters map to themselves, anything else to '_'."""
+
+    def __missing__(self, key: int) -> int:
+        return 95  # "_"
+
+
+_SLUG_CHARS = frozenset(string.ascii_letters + string.digits + "_.+-")
+_SLUG_TABLE = _SlugTable((i, i if chr(i) in _SLUG_CHARS else 95) for i in range(128))
+_SLUG_RUNS = re.compile(r"[_-]+")
 
 
 def slugify(value: str) -> str:
     """Convert a string to a filesystem-safe slug."""
-    value = str(value)
-    value = re.sub(r"[^a-zA-Z0-9_.+-]+", "_", value)
-    return re.sub(r"[_-]+", "_", value).strip("_")
+    value = value.translate(_SLUG_TABLE)
+    if "-" in value or "__" in value:  # otherwise there is no run to collapse
+        value = _SLUG_RUNS.sub("_", value)
+    return value.strip("_")
 
 
 if os.name == "nt":  # Windows
@@ -50,21 +66,38 @@ if os.name == "nt":  # Windows
         return True
 
 else:
+    _ESRCH = errno.ESRCH
+    _EPERM = errno.EPERM
 
     def check_pid(pid: int) -> bool:
         """Check if a Unix process exists."""
+        if pid <= 0:  # kill() would address a process group, not a process
+            return False
         try:
-            from os import kill
-
-            kill(pid, 0)
+            os.kill(pid, 0)
         except OSError as err:
-            if err.errno == errno.ESRCH:  # No such process
+            e = err.errno
+            if e == _ESRCH:  # No such process
                 return False
-            elif err.errno == errno.EPERM:  # Process exists
+            elif e == _EPERM:  # Process exists
                 return True
             raise
         return True
 
+    if hasattr(os, "pidfd_open"):  # Linux 5.3+
+        _check_pid_kill = check_pid
+
+        def check_pid(pid: int) -> bool:
+            """Check if a Linux process exists by opening a pidfd to it."""
+            try:
+                fd = os.pidfd_open(pid)
+            except ProcessLookupError:
+                return False
+            except OSError:  # e.g. ENOSYS on older kernels
+                return _check_pid_kill(pid)
+            os.close(fd)
+            return True
+
     def kill_pid(
         pid: int,
         sig: Optional[int] = signal.SIGTERM,
@@ -77,32 +110,75 @@ else:
                 os.kill(pid, sig)
             return True
         except OSError as e:
-            if e.errno == errno.ESRCH:  # No such process/group
+            if e.errno == _ESRCH:  # No such process/group
                 return False
             raise
 
 
+@lru_cache(maxsize=1024)
 def get_base_name(name: str) -> str:
     """Generate a consistent base filename from name."""
-    md = hashlib.md5()
-    md.update(name.encode())
-    return f"{slugify(name)[:24]}_{md.hexdigest()[:24]}"
-
-
-import random
+    # only disambiguates file names, no need for a cryptographic-grade digest
+    digest = hashlib.blake2b(name.encode(), digest_size=12).hexdigest()
+    return f"{slugify(name)[:24]}_{digest}"
 
 
 def look(id: str, runs: "list[dict[str, object]]"):
     """Find by 'name' or partial match."""
     m = None
+    many = False
     for x in runs:
-        if x["name"] == id:
-            return x
-        elif id in x["name"]:
-            if m is not None:
-                return False  # more than one partial match
-            m = x
-    return m
+        name = x["name"]
+        if name == id:
+            return x  # an exact match wins over any partial ones
+        elif id in name:
+            if m is None:
+                m = x
+            else:
+                many = True
+    return False if many else m  # False: more than one partial match
+
+
+def look_each(ids: "list[str]", runs: "list[dict[str, Any]]") -> Iterator["tuple[str, list[dict[str, Any]]]"]:
+    """Yield each distinct id, in order, with its exact matches or else its partial ones."""
+    runs = list(runs)
+    by_name: "dict[str, list[dict[str, Any]]]" = {}
+    for item in runs:
+        by_name.setdefault(item["name"], []).append(item)
+    ids = list(dict.fromkeys(ids))
+    # ids without an exact hit are matched as substrings in a single pass over the runs
+    partials: "dict[str, list[dict[str, Any]]]" = {id: [] for id in ids if id not in by_name}
+    if partials:
+        pending = list(partials.items())
+        for item in runs:
+            name = item["name"]
+            settled = False
+            for id, partial in pending:
+                if id in name:
+                    partial.append(item)
+                    settled = settled or len(partial) > 1
+            if settled:
+                # two partial hits already make an id ambiguous, stop testing it
+                pending = [x for x in pending if len(x[1]) < 2]
+                if not pending:
+                    break
+    for id in ids:
+        yield id, by_name.get(id) or partials[id]
+
+
+def pick_matches(
+    matches: "Iterable[tuple[str, list[dict[str, Any]]]]",
+    ambiguous: "Callable[[str], Any]" = lambda x: None,
+    not_found: "Callable[[str], Any]" = lambda x: None,
+) -> Iterator[Dict[str, Any]]:
+    """Yield the single match of each id, reporting the others."""
+    for id, found in matches:
+        if len(found) > 1:
+            ambiguous(id)
+        elif found:
+            yield found[0]
+        else:
+            not_found(id)
 
 
 def look_multiple(
@@ -111,27 +187,7 @@ def look_multiple(
     ambiguous: "Callable[[str], Any]" = lambda x: None,
     not_found: "Callable[[str], Any]" = lambda x: None,
 ) -> Iterator[Dict[str, Any]]:
-    map_ids = dict([(id, ([], [])) for id in ids])
-    for item in runs:
-        name = item["name"]
-        for id, (exact, partial) in map_ids.items():
-            if name == id:
-                exact.append(item)
-            elif id in name:
-                partial.append(item)
-    for id, (exact, partial) in map_ids.items():
-        if exact:
-            if len(exact) > 1:
-                ambiguous(id)
-            elif len(exact) > 0:
-                yield exact[0]
-        elif partial:
-            if len(partial) > 1:
-                ambiguous(id)
-            elif len(partial) > 0:
-                yield partial[0]
-        else:
-            not_found(id)
+    yield from pick_matches(look_each(ids, runs), ambiguous, not_found)
 
 
 def generate_pseudowords(word_count=4, syllables_per_word=2):
@@ -157,24 +213,28 @@ def generate_pseudowords(word_count=4, syllables_per_word=2):
     return "-".join(words)
 
 
-def tail_file(filename="", n=10):
-    """Efficiently reads last 'n' lines (like Unix 'tail')."""
+def tail_file(filename="", n=10) -> bytes:
+    """Efficiently reads last 'n' lines (like Unix 'tail'), as raw bytes."""
     with open(filename, "rb") as f:
-        # Seek to end, then step backwards to find line breaks
-        f.seek(0, 2)  # Move to EOF
-        end = f.tell()  # Get EOF position
-        line_count = 0
-        pos = end - 1  # Start at last byte
-
-        while pos >= 0 and line_count < n:
+        # Seek to end, then read blocks backwards until enough line breaks
+        pos = f.seek(0, 2)
+        chunks = []
+        breaks = 0
+        while pos > 0 and breaks <= n:
+            step = min(65536, pos)
+            pos -= step
             f.seek(pos)
-            char = f.read(1)
-            if char == b"\n":
-                line_count += 1
-            pos -= 1
-
-        f.seek(pos + 2)  # Rewind to start of last line
-        return f.read().splitlines()[-n:]
+            chunk = f.read(step)
+            breaks += chunk.count(b"\n")
+            chunks.append(chunk)
+        data = b"".join(reversed(chunks))
+    # only "\n" ends a line; a final one terminates the last line rather than starting another
+    i = len(data) - 1 if data.endswith(b"\n") else len(data)
+    for _ in range(n):
+        i = data.rfind(b"\n", 0, i)
+        if i < 0:
+            return data
+    return data[i + 1 :]
 
 
 def filesizepu(s: str) -> tuple[int, str]:
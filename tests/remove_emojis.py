@@ -1,39 +1,49 @@
 import re
 import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+
+_EMOJI_RE = re.compile(
+    "["
+    "\U0001f600-\U0001f64f"  # emoticons
+    "\U0001f300-\U0001f5ff"  # symbols & pictographs
+    "\U0001f680-\U0001f6ff"  # transport & map
+    "\U0001f700-\U0001f77f"  # alchemical
+    "\U0001f780-\U0001f7ff"  # Geometric Shapes Extended
+    "\U0001f800-\U0001f8ff"  # Supplemental Arrows-C
+    "\U0001f900-\U0001f9ff"  # Supplemental Symbols
+    "\U0001fa00-\U0001fa6f"  # Chess Symbols
+    "\U0001fa70-\U0001faff"  # Symbols Extended-A
+    "\U00002702-\U000027b0"  # Dingbats
+    "\U00002000-\U0001f251"
+    "]+",
+    flags=re.UNICODE,
+)
 
 
 def remove_emojis(text):
-    emoji_pattern = re.compile(
-        "["
-        "\U0001f600-\U0001f64f"  # emoticons
-        "\U0001f300-\U0001f5ff"  # symbols & pictographs
-        "\U0001f680-\U0001f6ff"  # transport & map
-        "\U0001f700-\U0001f77f"  # alchemical
-        "\U0001f780-\U0001f7ff"  # Geometric Shapes Extended
-        "\U0001f800-\U0001f8ff"  # Supplemental Arrows-C
-        "\U0001f900-\U0001f9ff"  # Supplemental Symbols
-        "\U0001fa00-\U0001fa6f"  # Chess Symbols
-        "\U0001fa70-\U0001faff"  # Symbols Extended-A
-        "\U00002702-\U000027b0"  # Dingbats
-        "\U00002000-\U0001f251"
-        "]+",
-        flags=re.UNICODE,
-    )
-    return emoji_pattern.sub(r"", text)
+    return _EMOJI_RE.sub(r"", text)
+
+
+def _clean_one(filepath):
+    with open(filepath, "r+", encoding="utf-8") as f:
+        content = f.read()
+        if not _EMOJI_RE.search(content):
+            return  # nothing to strip, leave the file and its mtime alone
+        f.seek(0)
+        f.write(remove_emojis(content))
+        f.truncate()
 
 
 def clean_py_files(directory):
-    for root, _, files in os.walk(directory):
-        for file in files:
-            if file.endswith(".py"):
-                filepath = os.path.join(root, file)
-                with open(filepath, "r+", encoding="utf-8") as f:
-                    content = f.read()
-                    f.seek(0)
-                    f.write(remove_emojis(content))
-                    f.truncate()
-
-
-x = os.environ.get("TARGET")
-if x:
-    clean_py_files(x)
+    paths = [str(p) for p in Path(directory).rglob("*.py")]
+    # files are independent and the regex holds the GIL, so use processes
+    with ProcessPoolExecutor() as ex:
+        list(ex.map(_clean_one, paths, chunksize=16))
+
+
+if __name__ == "__main__":  # pool workers re-import this module
+    x = os.environ.get("TARGET")
+    if x:
+        clean_py_files(x)
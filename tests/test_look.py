@@ -82,6 +82,20 @@ class TestLookMultiple(unittest.TestCase):
         self.assertEqual(self.not_found_calls, [])
         self.assertEqual(self.ambiguous_calls, ["a"])
 
+    def test_all_ambiguous(self):
+        """Test every id ambiguous, with an exact match still honoured"""
+        results = list(
+            look_multiple(
+                ["a", "p", "kiwi"],
+                self.test_data,
+                self.ambiguous_callback,
+                self.not_found_callback,
+            )
+        )
+        self.assertEqual([r["name"] for r in results], ["kiwi"])
+        self.assertEqual(self.ambiguous_calls, ["a", "p"])
+        self.assertEqual(self.not_found_calls, [])
+
     def test_not_found(self):
         """Test ID that doesn't exist"""
         results = list(
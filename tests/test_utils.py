@@ -1,13 +1,17 @@
+import json
 import os
+import re
+import signal
+import sqlite3
 from pathlib import Path
 from signal import SIGINT
 import subprocess
 import tempfile
 from time import sleep
-from unittest import TestCase, main
+from unittest import TestCase, main, skipUnless
 from runce.procdb import ProcessDB
 from runce.spawn import Spawn
-from runce.utils import kill_pid, slugify, get_base_name, look, tail_bytes
+from runce.utils import kill_pid, slugify, get_base_name, look, tail_bytes, tail_file
 
 
 class TestUtils(TestCase):
@@ -16,7 +20,9 @@ class TestUtils(TestCase):
         self.assertEqual(slugify("test@example.com"), "test_example.com")
         self.assertEqual(slugify("  extra  spaces  "), "extra_spaces")
         self.assertEqual(slugify("special!@#$%^&*()chars"), "special_chars")
-        # self.assertEqual(slugify("unicode-éèê"), "unicode_e_e_e")  # Uncomment if unicode handling is expected
+        self.assertEqual(slugify("a--b__c-_d"), "a_b_c_d")
+        self.assertEqual(slugify("unicode-éèê"), "unicode")
+        self.assertEqual(slugify("a\u00e9b"), "a_b")
 
     def test_get_base_name(self):
         name1 = get_base_name("test")
@@ -26,6 +32,8 @@ class TestUtils(TestCase):
         self.assertEqual(name1, name2)
         self.assertNotEqual(name1, name3)
         self.assertLessEqual(len(name1), 49)  # Max length check
+        self.assertRegex(name1, r"\Atest_[0-9a-f]{24}\Z")
+        self.assertRegex(get_base_name("x" * 100), r"\Ax{24}_[0-9a-f]{24}\Z")
 
     def test_spawn_data_dir(self):
         sp = Spawn()
@@ -45,6 +53,9 @@ class TestUtils(TestCase):
         self.assertIs(look("le", db), db[0])
         self.assertIs(look("citrus", db), None)
         self.assertIs(look("b", db), db[1])
+        db.append(dict(name="car"))
+        self.assertIs(look("car", db), db[4])
+        self.assertIs(look("ca", db), False)
 
     def test_tail_bytes(self):
         with tempfile.TemporaryDirectory() as tmp:
@@ -59,6 +70,126 @@ class TestUtils(TestCase):
             self.assertEqual(tail_bytes(str(file), 8), b"content")
             self.assertEqual(tail_bytes(str(file), 7), b"content")
 
+    def test_db_cmd_migration(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            # a version 0 database stored cmd as a Python repr
+            old_cmd = ["sh", "-c", "echo it's \"q\""]
+            json_cmd = '["echo", "it\'s"]'
+            conn = sqlite3.connect(Path(tmp) / "db")
+            with conn:
+                conn.execute(
+                    """CREATE TABLE processes (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT, uuid TEXT NOT NULL UNIQUE, pid INTEGER NOT NULL,
+                        name TEXT NOT NULL, cmd TEXT NOT NULL, out TEXT, err TEXT, started REAL NOT NULL,
+                        is_active INTEGER DEFAULT 1)"""
+                )
+                conn.execute(
+                    "INSERT INTO processes (uuid, pid, name, cmd, started) VALUES (?, ?, ?, ?, ?)",
+                    ("u1", 0, "old", repr(old_cmd), 0.0),
+                )
+                conn.execute(
+                    "INSERT INTO processes (uuid, pid, name, cmd, started) VALUES (?, ?, ?, ?, ?)",
+                    ("u2", 0, "new", json_cmd, 0.0),
+                )
+            conn.close()
+
+            pdb = ProcessDB()
+            pdb.data_dir = Path(tmp)
+            try:
+                self.assertEqual(pdb.find_name("old")["cmd"], old_cmd)
+                self.assertEqual(pdb.find_name("new")["cmd"], ["echo", "it's"])
+                self.assertEqual(pdb.conn.execute("PRAGMA user_version").fetchone()[0], 1)
+                raw = dict(pdb.conn.execute("SELECT name, cmd FROM processes").fetchall())
+                self.assertEqual(raw["new"], json_cmd)  # already JSON, left untouched
+                self.assertEqual(json.loads(raw["old"]), old_cmd)
+            finally:
+                pdb.conn.close()
+
+    def test_find_names(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            pdb = ProcessDB()
+            pdb.data_dir = Path(tmp)
+            try:
+                for i, name in enumerate(["dup", "dup", "alpha", "beta"]):
+                    pdb.add_process(
+                        dict(uuid=f"u{i}", pid=0, name=name, cmd=["true"], out="", err="", started=0.0)
+                    )
+                calls = []
+
+                def report(kind):
+                    return lambda x: calls.append((kind, x))
+
+                found = pdb.find_names(["be", "dup", "alpha", "zeta"], report("ambiguous"), report("not_found"))
+                for x in found:
+                    calls.append(("found", x["name"]))
+                # duplicate exact rows are ambiguous, and results follow the given id order
+                self.assertEqual(
+                    calls,
+                    [("found", "beta"), ("ambiguous", "dup"), ("found", "alpha"), ("not_found", "zeta")],
+                )
+            finally:
+                pdb.conn.close()
+
+    def test_find_by_exact_malformed(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            sp = Spawn()
+            sp.data_dir = Path(tmp)
+            for name, body in (("list", "[1]"), ("nameless", "{}"), ("broken", "{")):
+                Path(tmp, f"{get_base_name(name)}.run.json").write_text(body)
+                self.assertEqual(sp.find_by_exact(name), [])
+
+    def test_tail_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            top = Path(tmp)
+            zero = top / "zero.txt"
+            zero.touch()
+            self.assertEqual(tail_file(str(zero), 3), b"")
+
+            file = top / "file.txt"
+            file.write_bytes(b"a\nb\nc\n")
+            self.assertEqual(tail_file(str(file), 2), b"b\nc\n")
+            self.assertEqual(tail_file(str(file), 5), b"a\nb\nc\n")
+            # no trailing newline: the last partial line counts, nothing is added
+            file.write_bytes(b"a\nb\nc")
+            self.assertEqual(tail_file(str(file), 2), b"b\nc")
+            # only "\n" separates lines, "\r" stays inside them
+            file.write_bytes(b"l1\nprog 10%\rprog 50%\rprog 100%\nl3\n")
+            self.assertEqual(tail_file(str(file), 2), b"prog 10%\rprog 50%\rprog 100%\nl3\n")
+            file.write_bytes(b"a\r\nb\r\nc\r\n")
+            self.assertEqual(tail_file(str(file), 2), b"b\r\nc\r\n")
+
+            # spans several read blocks
+            lines = [b"%06d" % i + b"x" * 100 + b"\n" for i in range(2000)]
+            file.write_bytes(b"".join(lines))
+            self.assertEqual(tail_file(str(file), 3), b"".join(lines[-3:]))
+            self.assertEqual(tail_file(str(file), 1500), b"".join(lines[-1500:]))
+
+    @skipUnless(os.path.isdir("/proc/self/fd"), "needs procfs")
+    def test_spawn_signals_and_fds(self):
+        probe = ["sh", "-c", "grep SigIgn /proc/$$/status; ls /proc/$$/fd"]
+        r, w = os.pipe()
+        os.set_inheritable(w, True)
+        try:
+            with tempfile.TemporaryDirectory() as tmp:
+                sp = Spawn()
+                sp.data_dir = Path(tmp)
+                # default launch closes fds (posix_spawn with CLOSEFROM on 3.13+), close_fds=False keeps them
+                a = sp.spawn(probe, "default")
+                b = sp.spawn(probe, "keep-fds", close_fds=False)
+                sleep(1)
+                for x in (a, b):
+                    o = Path(x["out"]).read_text()
+                    m = re.search(r"SigIgn:\s*([0-9a-f]+)", o)
+                    self.assertTrue(m, o)
+                    ign = int(m.group(1), 16)
+                    self.assertFalse(ign & (1 << (signal.SIGPIPE - 1)), o)
+                    self.assertFalse(ign & (1 << (signal.SIGXFSZ - 1)), o)
+                fds = Path(a["out"]).read_text().split()[2:]
+                self.assertNotIn(str(w), fds)
+        finally:
+            os.close(r)
+            os.close(w)
+
     def test_spawn_echo(self):
         pdb = ProcessDB()
         kw = {}